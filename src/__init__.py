@@ -3,7 +3,6 @@
 
 """Library for uploading docs to charmhub."""
 import logging
-from itertools import tee
 
 from .action import DRY_RUN_NAVLINK_LINK, FAIL_NAVLINK_LINK
 from .action import run_all as run_all_actions
@@ -23,6 +22,7 @@ GETTING_STARTED = (
     "To get started with upload-charm-docs, "
     "please refer to https://github.com/canonical/upload-charm-docs#getting-started"
 )
+_PLACEHOLDER_LOCATIONS = frozenset((DRY_RUN_NAVLINK_LINK, FAIL_NAVLINK_LINK))
 
 
 def run_reconcile(clients: Clients, user_inputs: UserInputs) -> dict[str, str]:
@@ -63,20 +63,18 @@ def run_reconcile(clients: Clients, user_inputs: UserInputs) -> dict[str, str]:
         index.server.content if index.server is not None and index.server.content else ""
     )
     table_rows = navigation_table_from_page(page=server_content, discourse=clients.discourse)
-    actions = get_reconcile_actions(
-        path_infos=path_infos,
-        table_rows=table_rows,
-        clients=clients,
-        base_path=base_path,
+    # The actions are needed by both the conflict checks and running the actions, materialise them
+    # once since the checks consume all of them before any action is run
+    actions = tuple(
+        get_reconcile_actions(
+            path_infos=path_infos,
+            table_rows=table_rows,
+            clients=clients,
+            base_path=base_path,
+        )
     )
-
-    # tee creates a copy of the iterator which is needed as check_conflicts consumes the iterator
-    # it is passed
-    actions, check_actions = tee(actions, 2)
     problems = tuple(
-        check_conflicts(
-            actions=check_actions, repository=clients.repository, user_inputs=user_inputs
-        )
+        check_conflicts(actions=actions, repository=clients.repository, user_inputs=user_inputs)
     )
     if problems:
         raise InputError(
@@ -93,9 +91,7 @@ def run_reconcile(clients: Clients, user_inputs: UserInputs) -> dict[str, str]:
     urls_with_actions: dict[str, str] = {
         str(report.location): report.result
         for report in reports
-        if report.location is not None
-        and report.location != DRY_RUN_NAVLINK_LINK
-        and report.location != FAIL_NAVLINK_LINK
+        if report.location is not None and report.location not in _PLACEHOLDER_LOCATIONS
     }
 
     if not user_inputs.dry_run:
@@ -124,9 +120,11 @@ def run_migrate(clients: Clients, user_inputs: UserInputs) -> dict[str, str]:
         )
         return {}
 
-    logging.info("Tag exists: %s", str(clients.repository.tag_exists(DOCUMENTATION_TAG)))
+    # tag_exists fetches from the remote, only check once
+    tag_exists = clients.repository.tag_exists(DOCUMENTATION_TAG)
+    logging.info("Tag exists: %s", str(tag_exists))
 
-    if not clients.repository.tag_exists(DOCUMENTATION_TAG):
+    if not tag_exists:
         with clients.repository.with_branch(DEFAULT_BRANCH) as repo:
             main_hash = repo.current_commit
         clients.repository.tag_commit(DOCUMENTATION_TAG, main_hash)
@@ -51,29 +51,25 @@ def get_path_with_diffs(actions: Iterable[UpdateAction]) -> PathsWithDiff:
     Returns:
         The paths that have differences.
     """
-    # Filter any actions without a change in content or None base or same local and server content
-    actions_with_changes = (
-        action
-        for action in actions
-        if action.content_change is not None
-        and action.content_change.base is not None
-        and action.content_change.local != action.content_change.server
-    )
-    # The access to optional attributes is safe because of the filter above, mypy doesn't track
-    # to this degree
-    # Need an iterator for both attributes
-    base_local_actions, base_server_actions = tee(actions_with_changes)
+    base_local_diffs: list[str] = []
+    base_server_diffs: list[str] = []
+    # Single pass over the actions, skipping any action without a change in content or None base
+    # or same local and server content
+    for action in actions:
+        content_change = action.content_change
+        if (
+            content_change is None
+            or content_change.base is None
+            or content_change.local == content_change.server
+        ):
+            continue
+        if content_change.base != content_change.local:
+            base_local_diffs.append(format_path(action.path))
+        if content_change.base != content_change.server:
+            base_server_diffs.append(format_path(action.path))
+
     return PathsWithDiff(
-        base_local_diffs=tuple(
-            format_path(action.path)
-            for action in base_local_actions
-            if action.content_change.base != action.content_change.local  # type: ignore
-        ),
-        base_server_diffs=tuple(
-            format_path(action.path)
-            for action in base_server_actions
-            if action.content_change.base != action.content_change.server  # type: ignore
-        ),
+        base_local_diffs=tuple(base_local_diffs), base_server_diffs=tuple(base_server_diffs)
     )
 
 
@@ -2,7 +2,10 @@
 # See LICENSE file for licensing details.
 
 """Class for reading the docs directory."""
+import errno
 import itertools
+import os
+import stat
 import typing
 from functools import partial
 from itertools import count
@@ -11,6 +14,9 @@ from pathlib import Path
 from . import types_
 from .constants import DOCUMENTATION_FOLDER_NAME
 
+# Errors that Path.is_file treats as the path not being a file, e.g., a dangling or looping symlink
+_NOT_A_FILE_ERRNOS = frozenset((errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP))
+
 
 def _get_directories_files(docs_path: Path) -> list[Path]:
     """Get all the directories and documentation files recursively in the docs directory.
@@ -21,11 +27,18 @@ def _get_directories_files(docs_path: Path) -> list[Path]:
     Returns:
         List with all the directories and documentation files in the docs directory.
     """
-    return sorted(
-        path
-        for path in docs_path.rglob("*")
-        if path.is_dir() or (path.suffix.lower() == ".md" and not path.stem.lower() == "index")
-    )
+    paths: list[Path] = []
+    # os.walk is based on os.scandir which already knows whether each entry is a directory,
+    # avoiding a stat call for every path in the docs directory
+    for directory, directory_names, file_names in os.walk(docs_path):
+        directory_path = Path(directory)
+        paths.extend(directory_path / directory_name for directory_name in directory_names)
+        paths.extend(
+            path
+            for path in (directory_path / file_name for file_name in file_names)
+            if path.suffix.lower() == ".md" and not path.stem.lower() == "index"
+        )
+    return sorted(paths)
 
 
 def _calculate_level(path_relative_to_docs: Path) -> types_.Level:
@@ -39,7 +52,9 @@ def _calculate_level(path_relative_to_docs: Path) -> types_.Level:
         The number of sub-directories from the path to the docs directory including the docs
         directory.
     """
-    return len(path_relative_to_docs.parents)
+    # For a relative path the number of parts matches the number of parents without building the
+    # sequence of parent paths
+    return len(path_relative_to_docs.parts)
 
 
 def calculate_table_path(path_relative_to_docs: Path) -> types_.TablePath:
@@ -86,18 +101,25 @@ def _calculate_navlink_title(path: Path) -> types_.NavlinkTitle:
         the extension with - replaced by space and titlelized if the file is empty or it is a
         directory.
     """
-    # Check for file with content
-    if path.is_file() and path.stat().st_size:
-        content_lines = path.read_text(encoding="utf-8").splitlines()
-        heading_start = "# "
-        try:
-            return next(
-                line.removeprefix(heading_start)
-                for line in content_lines
-                if line.startswith(heading_start)
-            )
-        except StopIteration:
-            return content_lines[0]
+    # Check for file with content, a single stat provides both the file type and the size. A
+    # dangling or looping symlink cannot be stat'ed and falls back to the name like a directory
+    try:
+        path_stat = path.stat()
+    except OSError as exc:
+        if exc.errno not in _NOT_A_FILE_ERRNOS:
+            raise
+    else:
+        if stat.S_ISREG(path_stat.st_mode) and path_stat.st_size:
+            content_lines = path.read_text(encoding="utf-8").splitlines()
+            heading_start = "# "
+            try:
+                return next(
+                    line.removeprefix(heading_start)
+                    for line in content_lines
+                    if line.startswith(heading_start)
+                )
+            except StopIteration:
+                return content_lines[0]
 
     return path.stem.replace("-", " ").replace("_", " ").title()
 
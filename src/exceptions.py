@@ -24,10 +24,6 @@ class DiscourseError(BaseError):
     """Parent exception for all Discourse errors."""
 
 
-class NavigationTableParseError(BaseError):
-    """A problem with the navigation table parsing occurred."""
-
-
 class ReconcilliationError(BaseError):
     """A problem with the reconcilliation occurred."""
 
@@ -25,12 +25,12 @@ def _read_docs_index(base_path: Path) -> str | None:
         The content of the index file if it exists, otherwise return None.
 
     """
-    if not (docs_directory := base_path / DOCUMENTATION_FOLDER_NAME).is_dir():
+    index_file = base_path / DOCUMENTATION_FOLDER_NAME / DOCUMENTATION_INDEX_FILENAME
+    # Attempting the read directly avoids checking the directory and file exist beforehand
+    try:
+        return index_file.read_text()
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
         return None
-    if not (index_file := docs_directory / DOCUMENTATION_INDEX_FILENAME).is_file():
-        return None
-
-    return index_file.read_text()
 
 
 def get(metadata: Metadata, base_path: Path, server_client: Discourse) -> Index:
@@ -77,5 +77,4 @@ def contents_from_page(page: str) -> str:
     Returns:
         Index file contents.
     """
-    contents = page.split(NAVIGATION_TABLE_START)
-    return contents[0]
+    return page.partition(NAVIGATION_TABLE_START)[0]
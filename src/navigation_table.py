@@ -9,7 +9,7 @@ import typing
 
 from . import types_
 from .discourse import Discourse
-from .exceptions import DiscourseError, NavigationTableParseError, PagePermissionError, ServerError
+from .exceptions import DiscourseError, PagePermissionError, ServerError
 
 _WHITESPACE = r"\s*"
 _TABLE_HEADER_REGEX = (
@@ -19,9 +19,6 @@ _TABLE_HEADER_REGEX = (
     rf"{_WHITESPACE}navlink{_WHITESPACE}\|{_WHITESPACE}"
 )
 _TABLE_HEADER_PATTERN = re.compile(_TABLE_HEADER_REGEX, re.IGNORECASE)
-_TABLE_PATTERN = re.compile(rf"[\s\S]*{_TABLE_HEADER_REGEX}[\s\S]*\|?", re.IGNORECASE)
-_FILLER_ROW_REGEX_COLUMN = rf"{_WHITESPACE}-+{_WHITESPACE}\|"
-_FILLER_ROW_PATTERN = re.compile(rf"{_WHITESPACE}\|{_FILLER_ROW_REGEX_COLUMN * 3}{_WHITESPACE}")
 _LEVEL_REGEX = rf"{_WHITESPACE}(\d+){_WHITESPACE}"
 _PATH_REGEX = rf"{_WHITESPACE}([\w-]+){_WHITESPACE}"
 _PUNCTUATION = string.punctuation.replace("/", "\\/")
@@ -34,40 +31,27 @@ _NAVLINK_REGEX = (
 _ROW_PATTERN = re.compile(rf"{_WHITESPACE}\|{_LEVEL_REGEX}\|{_PATH_REGEX}\|{_NAVLINK_REGEX}\|")
 
 
-def _filter_line(line: str) -> bool:
-    """Check whether a line should be parsed.
-
-    Args:
-        line: The line to check.
-
-    Returns:
-        Whether the line should be parsed.
-    """
-    if _TABLE_HEADER_PATTERN.match(line) is not None:
-        return True
-    if _FILLER_ROW_PATTERN.match(line) is not None:
-        return True
-    if _ROW_PATTERN.match(line) is not None:
-        return False
-    return True
-
-
-def _line_to_row(line: str) -> types_.TableRow:
+def _line_to_row(line: str) -> types_.TableRow | None:
     """Parse a markdown table line.
 
+    The header and filler rows of the table never match the row pattern so a single match is
+    enough to both detect and parse a row.
+
     Args:
         line: The line to process.
 
     Returns:
-        The parsed row.
-
-    Raises:
-        NavigationTableParseError: if no match is found for the line.
+        The parsed row or None if the line is not a row of the table.
     """
+    # Every row contains the column separator, checking for it first avoids running the regular
+    # expression against the prose lines of the page
+    if "|" not in line:
+        return None
+
     match = _ROW_PATTERN.match(line)
 
     if match is None:
-        raise NavigationTableParseError(f"Invalid table row, {line=!r}")
+        return None
 
     level = int(match.group(1))
     path: types_.TablePath = (match.group(2),)
@@ -114,11 +98,12 @@ def from_page(page: str, discourse: Discourse) -> typing.Iterator[types_.TableRo
     """Create an instance based on a markdown page.
 
     Algorithm:
-        1.  Extract the table based on a regular expression looking for a 3 column table with
-            the headers level, path and navlink (case insensitive). If the table is not found,
-            assume that it is equivalent to a table without rows.
+        1.  Search for the header of a 3 column table with the headers level, path and navlink
+            (case insensitive). If the header is not found, assume that it is equivalent to a
+            table without rows.
         2.  Process the rows line by line:
-            2.1. If the row matches the header or filler pattern, skip it.
+            2.1. If the line does not match the row pattern, such as the header or filler rows,
+                skip it.
             2.2. Extract the level, path and navlink values.
 
     Args:
@@ -128,15 +113,14 @@ def from_page(page: str, discourse: Discourse) -> typing.Iterator[types_.TableRo
     Returns:
         The parsed rows from the table.
     """
-    match = _TABLE_PATTERN.match(page)
-
-    if match is None:
+    # Searching for the header avoids the backtracking of matching the whole page against a
+    # pattern with unbounded wildcards on both sides of the header
+    if _TABLE_HEADER_PATTERN.search(page) is None:
         return iter([])
 
-    table = match.group(0)
     return (
         _check_table_row_write_permission(row, discourse=discourse)
-        for row in generate_table_row(table.splitlines())
+        for row in generate_table_row(page.splitlines())
     )
 
 
@@ -153,11 +137,11 @@ def generate_table_row(lines: typing.Sequence[str]) -> typing.Iterator[types_.Ta
     path_components: tuple[str, ...] = ()
 
     for line in lines:
-        if not _filter_line(line):
-            row = _line_to_row(line)
+        if (row := _line_to_row(line)) is None:
+            continue
 
-            prefix = path_components[: len(path_components) - (level - row.level) - 1]
-            path_components = prefix + (row.path[0].removeprefix("-".join(prefix) + "-"),)
-            level = row.level
+        prefix = path_components[: len(path_components) - (level - row.level) - 1]
+        path_components = prefix + (row.path[0].removeprefix("-".join(prefix) + "-"),)
+        level = row.level
 
-            yield types_.TableRow(row.level, path_components, row.navlink)
+        yield types_.TableRow(row.level, path_components, row.navlink)
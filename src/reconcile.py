@@ -262,12 +262,14 @@ def _local_and_server(
     """
     _local_and_server_validation(path_info=path_info, table_row=table_row)
 
+    local_is_dir = path_info.local_path.is_dir()
+
     # Is a directory locally and a grouping on the server
-    if path_info.local_path.is_dir() and table_row.is_group:
+    if local_is_dir and table_row.is_group:
         return _local_and_server_dir_local_group_server(path_info=path_info, table_row=table_row)
 
     # Is a directory locally and a page on the server
-    if path_info.local_path.is_dir():
+    if local_is_dir:
         return _local_and_server_file_local_group_server(
             path_info=path_info, table_row=table_row, clients=clients
         )
@@ -30,8 +30,8 @@ def assert_substrings_in_string(substrings: typing.Iterable[str], string: str) -
         substrings: The sub strings that must be contained in the string.
 
     """
-    for substring in substrings:
-        assert substring in string, f"{substring!r} not in {string!r}"  # nosec
+    missing = [substring for substring in substrings if substring not in string]
+    assert not missing, f"{missing!r} not in {string!r}"  # nosec
 
 
 def path_to_markdown(path: Path) -> Path:
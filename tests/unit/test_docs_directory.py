@@ -301,6 +301,20 @@ def test__calculate_navlink_title(
     assert returned_navlink_title == expected_navlink_title
 
 
+def test__calculate_navlink_title_dangling_symlink(tmp_path: Path):
+    """
+    arrange: given docs directory with a markdown file that is a symlink to a missing file
+    act: when _calculate_navlink_title is called with the symlink
+    assert: then the title is calculated from the file name.
+    """
+    path = tmp_path / "broken-link.md"
+    path.symlink_to(tmp_path / "missing.md")
+
+    returned_navlink_title = docs_directory._calculate_navlink_title(path=path)
+
+    assert returned_navlink_title == "Broken Link"
+
+
 def test__get_path_info(tmp_path: Path):
     """
     arrange: given docs directory with a directory
@@ -42,6 +42,35 @@ def test__read_docs_index_index_file_missing(tmp_path: Path):
     assert returned_content is None
 
 
+def test__read_docs_index_docs_path_file(tmp_path: Path):
+    """
+    arrange: given directory with a file in place of the docs folder
+    act: when _read_docs_index is called with the directory
+    assert: then None is returned.
+    """
+    (tmp_path / constants.DOCUMENTATION_FOLDER_NAME).touch()
+
+    returned_content = index._read_docs_index(base_path=tmp_path)
+
+    assert returned_content is None
+
+
+def test__read_docs_index_index_file_directory(tmp_path: Path):
+    """
+    arrange: given directory with the docs folder and a directory in place of the index file
+    act: when _read_docs_index is called with the directory
+    assert: then None is returned.
+    """
+    index_path = (
+        tmp_path / constants.DOCUMENTATION_FOLDER_NAME / constants.DOCUMENTATION_INDEX_FILENAME
+    )
+    index_path.mkdir(parents=True)
+
+    returned_content = index._read_docs_index(base_path=tmp_path)
+
+    assert returned_content is None
+
+
 def test__read_docs_index_index_file(index_file_content: str, tmp_path: Path):
     """
     arrange: given directory with the docs folder and index file
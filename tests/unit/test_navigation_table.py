@@ -11,69 +11,65 @@ from unittest import mock
 import pytest
 
 from src import discourse, exceptions, navigation_table, types_
-from src.exceptions import NavigationTableParseError
 
 from .helpers import assert_substrings_in_string
 
 
 @pytest.mark.parametrize(
-    "line, expected_result",
+    "line",
     [
-        pytest.param("", True, id="empty"),
-        pytest.param("unmatched line", True, id="does not match any line regex"),
-        pytest.param("||||", True, id="line with nothing"),
-        pytest.param("|level|path|navlink|", True, id="matches the header lower case"),
-        pytest.param("|LEVEL|PATH|NAVLINK|", True, id="matches the header upper case"),
-        pytest.param("|Level|Path|Navlink|", True, id="matches the header mixed case"),
-        pytest.param(" |level|path|navlink|", True, id="matches the header single leading space"),
+        pytest.param("", id="empty"),
+        pytest.param("unmatched line", id="does not match any line regex"),
+        pytest.param("||||", id="line with nothing"),
+        pytest.param("|level|path|navlink|", id="header lower case"),
+        pytest.param("|LEVEL|PATH|NAVLINK|", id="header upper case"),
+        pytest.param("|Level|Path|Navlink|", id="header mixed case"),
+        pytest.param(" |level|path|navlink|", id="header single leading space"),
         # This test ensures that the whitespace check includes looking for multiple spaces, needed
         # only once since the same regular expression is used for all whitespace checks
-        pytest.param(
-            "  |level|path|navlink|", True, id="matches the header multiple leading space"
-        ),
+        pytest.param("  |level|path|navlink|", id="header multiple leading space"),
         # This test ensures that the whitespace check includes looking for tabs, needed only once
         # since the same regular expression is used for all whitespace checks
-        pytest.param("\t|level|path|navlink|", True, id="matches the header leading tab"),
-        pytest.param("| level|path|navlink|", True, id="matches the header space before level"),
-        pytest.param("|level |path|navlink|", True, id="matches the header space after level"),
-        pytest.param("|level| path|navlink|", True, id="matches the header space before path"),
-        pytest.param("|level|path |navlink|", True, id="matches the header space after path"),
-        pytest.param("|level|path| navlink|", True, id="matches the header space before navlink"),
-        pytest.param("|level|path|navlink |", True, id="matches the header space after navlink"),
-        pytest.param("|level|path|navlink| ", True, id="matches the header trailing space"),
-        pytest.param("|-|-|-|", True, id="matches filler single dash"),
-        pytest.param("|--|--|--|", True, id="matches filler multiple dash"),
-        pytest.param(" |-|-|-|", True, id="matches filler leading space"),
-        pytest.param("| -|-|-|", True, id="matches filler space before first column"),
-        pytest.param("|- |-|-|", True, id="matches filler space after first column"),
-        pytest.param("|-| -|-|", True, id="matches filler space before second column"),
-        pytest.param("|-|- |-|", True, id="matches filler space after second column"),
-        pytest.param("|-|-| -|", True, id="matches filler space before third column"),
-        pytest.param("|-|-|- |", True, id="matches filler space after third column"),
-        pytest.param("|-|-|-| ", True, id="matches filler trailing space"),
-        pytest.param("||a|[a]()|", True, id="first column empty"),
-        pytest.param("|a|a|[a]()|", True, id="first column character"),
-        pytest.param("|1||[a]()|", True, id="second column empty"),
-        pytest.param("|1|/|[a]()|", True, id="second column forward slash"),
-        pytest.param("|1|a||", True, id="third column empty"),
-        pytest.param("|1|a|a]()|", True, id="third column leading square bracket missing"),
-        pytest.param("|1|a|[]()|", True, id="third column title missing"),
-        pytest.param("|1|a|[a()|", True, id="third column closing square bracket missing"),
-        pytest.param("|1|a|[a])|", True, id="third column opening link bracket missing"),
-        pytest.param(r"|1|a|[a](\)|", True, id="third column link includes backslash"),
-        pytest.param("|1|a|[a](|", True, id="third column closing link bracket missing"),
-        pytest.param("|1|a|[a]()|", False, id="matches row"),
+        pytest.param("\t|level|path|navlink|", id="header leading tab"),
+        pytest.param("| level|path|navlink|", id="header space before level"),
+        pytest.param("|level |path|navlink|", id="header space after level"),
+        pytest.param("|level| path|navlink|", id="header space before path"),
+        pytest.param("|level|path |navlink|", id="header space after path"),
+        pytest.param("|level|path| navlink|", id="header space before navlink"),
+        pytest.param("|level|path|navlink |", id="header space after navlink"),
+        pytest.param("|level|path|navlink| ", id="header trailing space"),
+        pytest.param("|-|-|-|", id="filler single dash"),
+        pytest.param("|--|--|--|", id="filler multiple dash"),
+        pytest.param(" |-|-|-|", id="filler leading space"),
+        pytest.param("| -|-|-|", id="filler space before first column"),
+        pytest.param("|- |-|-|", id="filler space after first column"),
+        pytest.param("|-| -|-|", id="filler space before second column"),
+        pytest.param("|-|- |-|", id="filler space after second column"),
+        pytest.param("|-|-| -|", id="filler space before third column"),
+        pytest.param("|-|-|- |", id="filler space after third column"),
+        pytest.param("|-|-|-| ", id="filler trailing space"),
+        pytest.param("||a|[a]()|", id="first column empty"),
+        pytest.param("|a|a|[a]()|", id="first column character"),
+        pytest.param("|1||[a]()|", id="second column empty"),
+        pytest.param("|1|/|[a]()|", id="second column forward slash"),
+        pytest.param("|1|a||", id="third column empty"),
+        pytest.param("|1|a|a]()|", id="third column leading square bracket missing"),
+        pytest.param("|1|a|[]()|", id="third column title missing"),
+        pytest.param("|1|a|[a()|", id="third column closing square bracket missing"),
+        pytest.param("|1|a|[a])|", id="third column opening link bracket missing"),
+        pytest.param(r"|1|a|[a](\)|", id="third column link includes backslash"),
+        pytest.param("|1|a|[a](|", id="third column closing link bracket missing"),
     ],
 )
-def test__filter_line(line, expected_result):
+def test__line_to_row_not_row(line: str):
     """
-    arrange: given line and expected return value
-    act: when _filter_line is called with the line
-    assert: then the expected return value is returned.
+    arrange: given line that is not a row of the table
+    act: when _line_to_row is called with the line
+    assert: then None is returned.
     """
-    returned_result = navigation_table._filter_line(line)
+    returned_result = navigation_table._line_to_row(line)
 
-    assert returned_result == expected_result
+    assert returned_result is None
 
 
 @pytest.mark.parametrize(
@@ -175,16 +171,6 @@ def test__line_to_row(line: str, expected_result: types_.TableRow):
     assert returned_result == expected_result
 
 
-def test__line_to_row_no_match():
-    """
-    arrange: given line that does not match
-    act: when _line_to_row is called with the line
-    assert: then NavigationTableParseError is raised.
-    """
-    with pytest.raises(NavigationTableParseError):
-        navigation_table._line_to_row("")
-
-
 def test__check_table_row_write_permission_group():
     """
     arrange: given mocked discourse and table row for a group